@@ -23,7 +23,7 @@ class EufyClean:
     async def get_devices(self):
         return self.eufyCleanApi.mqtt_devices
 
-    async def init_device(self, device_id: str) -> MqttConnect:
+    async def init_device(self, device_id: str, debug: bool = False) -> MqttConnect:
         devices = await self.get_devices()
         device = next((d for d in devices if d['deviceId'] == device_id), None)
 
@@ -33,7 +33,8 @@ class EufyClean:
         if not device['mqtt']:
             raise Exception('Device is not a MQTT device')
 
-        return MqttConnect(device, self.openudid, self.eufyCleanApi)
+        # The entry's debug option rides along in the connection config
+        return MqttConnect({**device, 'debug': debug}, self.openudid, self.eufyCleanApi)
 
     async def get_user_info(self):
         return await self.eufyCleanApi.eufyApi.get_user_info()
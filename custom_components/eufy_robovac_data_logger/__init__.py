@@ -1,12 +1,15 @@
 import logging
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from .EufyClean import EufyClean
 
-from .constants.hass import DOMAIN, VACS, DEVICES
+from .const import CONF_DEBUG_MODE
+from .constants.hass import DOMAIN, VACS, DEVICES, SIGNAL_DEVICE_UPDATED
 
 PLATFORMS = [Platform.VACUUM, Platform.BUTTON, Platform.SENSOR]
 _LOGGER = logging.getLogger(__name__)
@@ -26,13 +29,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     eufy_clean = EufyClean(username, password)
     await eufy_clean.init()
 
+    # Options win over the value stored at setup, as in the options flow
+    debug_mode = entry.options.get(
+        CONF_DEBUG_MODE,
+        entry.data.get(CONF_DEBUG_MODE, False)
+    )
+
     # Load devices
     for vacuum in await eufy_clean.get_devices():
-        device = await eufy_clean.init_device(vacuum['deviceId'])
+        device = await eufy_clean.init_device(vacuum['deviceId'], debug=debug_mode)
         await device.connect()
         _LOGGER.info("Adding %s", device.device_id)
         hass.data[DOMAIN][DEVICES][device.device_id] = device
 
+        # One signal per device update wakes every entity subscribed to it
+        listener = partial(
+            async_dispatcher_send, hass, SIGNAL_DEVICE_UPDATED.format(device.device_id)
+        )
+        device.add_listener(listener)
+        entry.async_on_unload(partial(device.remove_listener, listener))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -1,19 +1,21 @@
 """Button platform for Eufy Robovac Data Logger integration."""
-import json
 import logging
+import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+import orjson
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .constants.devices import EUFY_CLEAN_DEVICES
-
-DOMAIN = "eufy_robovac_data_logger"
-DEVICES = "devices"
+from .const import (DPS_KEYS_150_180, DPS_KEYS_150_180_SET,
+                    DPS_KEYS_TO_LOG_COUNT, LOG_DIR, LOG_FILE_NAME,
+                    MAX_LOG_BYTES, MAX_LOG_FILES)
+from .constants.hass import DEVICES, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,12 +27,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up Eufy Data Logger buttons - following eufy-clean pattern."""
     
+    buttons = []
     for device_id, device in hass.data[DOMAIN][DEVICES].items():
         _LOGGER.info("Adding log button for %s", device_id)
         
         # Create log button for this device
-        log_button = EufyDataLoggerButton(hass, device, device_id)
-        async_add_entities([log_button])
+        buttons.append(EufyDataLoggerButton(hass, device, device_id))
+
+    async_add_entities(buttons)
 
 
 class EufyDataLoggerButton(ButtonEntity):
@@ -41,14 +45,23 @@ class EufyDataLoggerButton(ButtonEntity):
         self.hass = hass
         self.device = device
         self.device_id = device_id
+        # Read-only live view - the connection updates the dict in place
+        self._robovac_data = device.robovac_data_view
         
         # Get device info
-        self.device_model = device.device_model if hasattr(device, 'device_model') else "Unknown"
-        self.device_name = device.device_model_desc if hasattr(device, 'device_model_desc') else device_id
+        self.device_model = device.device_model or "Unknown"
+        self.device_name = device.device_model_desc or device_id
         
         self._attr_unique_id = f"{device_id}_log_dps_data"
         self._attr_name = f"Log DPS Data"
         self._attr_icon = "mdi:file-export"
+        self._last_log_hash = 0
+        # Connection dps_revision already covered by the last log
+        self._last_log_revision = -1
+        # (key set, ordered keys) from the last press - the key set rarely changes
+        self._sorted_keys_cache: tuple[frozenset, tuple[str, ...]] = (frozenset(), ())
+        self._log_dir = Path(hass.config.path(LOG_DIR)) / device_id
+        self._log_file = self._log_dir / LOG_FILE_NAME
         
         # Device info - like eufy-clean does it
         self._attr_device_info = DeviceInfo(
@@ -58,52 +71,60 @@ class EufyDataLoggerButton(ButtonEntity):
             model=self.device_model,
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Create the device log directory once."""
+        await super().async_added_to_hass()
+        await self.hass.async_add_executor_job(
+            partial(self._log_dir.mkdir, parents=True, exist_ok=True)
+        )
+
     async def async_press(self) -> None:
         """Handle the button press - log DPS data."""
         _LOGGER.info("Log button pressed for device %s", self.device_id)
         
+        # No DPS value changed since the last log - nothing to encode or write
+        revision = self.device.dps_revision
+        if revision == self._last_log_revision:
+            _LOGGER.info("No change since last log for device %s, skipping", self.device_id)
+            return
+
         # Get all robovac_data (includes DPS keys)
-        robovac_data = getattr(self.device, 'robovac_data', {})
+        robovac_data = self._robovac_data
         
         if not robovac_data:
             _LOGGER.warning("No robovac_data available for device %s", self.device_id)
             return
             
         # Debug: Log all available keys
-        all_keys = list(robovac_data.keys())
-        _LOGGER.debug("All available keys: %s", all_keys)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("All available keys: %s", list(robovac_data))
         
-        # Collect all DPS data (numeric keys from 150-180)
-        dps_data = {}
-        for key in robovac_data:
-            try:
-                # Check if key is numeric and in range 150-180
-                if isinstance(key, str) and key.isdigit():
-                    key_num = int(key)
-                    if 150 <= key_num <= 180:
-                        dps_data[key] = robovac_data[key]
-            except (ValueError, TypeError):
-                continue
+        # Collect all DPS data (keys 150-180)
+        present = DPS_KEYS_150_180_SET & robovac_data.keys()
                 
-        if not dps_data:
+        if not present:
             _LOGGER.warning("No DPS data (keys 150-180) found for device %s", self.device_id)
             return
+
+        if present != self._sorted_keys_cache[0]:
+            # DPS_KEYS_150_180 is already ascending - filter it, no sort needed
+            self._sorted_keys_cache = (present, tuple(k for k in DPS_KEYS_150_180 if k in present))
+        dps_data = {key: robovac_data[key] for key in self._sorted_keys_cache[1]}
+
+        # Changes outside 150-180 also bump the revision - compare the payload
+        digest = hash(orjson.dumps(dps_data, option=orjson.OPT_SORT_KEYS, default=str))
+        if digest == self._last_log_hash:
+            self._last_log_revision = revision
+            _LOGGER.info("No change since last log for device %s, skipping", self.device_id)
+            return
             
-        # Create timestamp for filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"dps_log_{timestamp}.json"
-        
-        # Create directory structure
-        base_path = Path("/config/eufy_dps_logs")
-        device_path = base_path / self.device_id
-        device_path.mkdir(parents=True, exist_ok=True)
-        
-        # Full file path
-        filepath = device_path / filename
+        # Create timestamps for log body and rotation name from one clock read
+        now = time.time()
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
         
         # Prepare data to write
         log_data = {
-            "timestamp": timestamp,
+            "timestamp": datetime.fromtimestamp(now).isoformat(),
             "device_id": self.device_id,
             "device_model": self.device_model,
             "dps_data": dps_data
@@ -111,14 +132,29 @@ class EufyDataLoggerButton(ButtonEntity):
         
         # FIX: Use executor to avoid blocking call
         await self.hass.async_add_executor_job(
-            self._write_json_file, filepath, log_data
+            self._append_log_line, log_data, timestamp
         )
+        self._last_log_hash = digest
+        self._last_log_revision = revision
         
-        _LOGGER.info("Successfully logged %d DPS keys (150-180) to %s", 
-                    len(dps_data), filename)
-        _LOGGER.info("Full path: %s", filepath)
+        _LOGGER.info("Successfully logged %d/%d DPS keys (150-180) to %s", 
+                    len(dps_data), DPS_KEYS_TO_LOG_COUNT, self._log_file)
     
-    def _write_json_file(self, filepath, data):
-        """Write JSON file - sync method for executor."""
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
\ No newline at end of file
+    def _append_log_line(self, data, timestamp):
+        """Append one NDJSON line, rotating by size - sync method for executor."""
+        line = orjson.dumps(data, default=str) + b"\n"
+
+        try:
+            size = self._log_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+
+        if size and size + len(line) > MAX_LOG_BYTES:
+            self._log_file.rename(self._log_dir / f"dps_log_{timestamp}.ndjson")
+            # Timestamped names sort chronologically, so drop the oldest extras
+            rotated = sorted(self._log_dir.glob("dps_log_*.ndjson"))
+            for old_file in rotated[:-MAX_LOG_FILES]:
+                old_file.unlink(missing_ok=True)
+
+        with open(self._log_file, 'ab') as f:
+            f.write(line)
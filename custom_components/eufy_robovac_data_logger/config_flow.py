@@ -8,6 +8,7 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import DOMAIN, CONF_DEBUG_MODE
+from .controllers.Login import EufyLogin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,9 +57,6 @@ class EufyDataLoggerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     # Create login instance with generated UDID
                     self.openudid = f"ha_debug_{str(uuid.uuid4())[:8]}"
                     
-                    # Import with correct case sensitivity
-                    from .controllers.Login import EufyLogin
-                    
                     eufy_login = EufyLogin(
                         username=user_input[CONF_USERNAME],
                         password=user_input[CONF_PASSWORD],
@@ -11,12 +11,24 @@ UPDATE_INTERVAL = 10
 
 # DPS keys to log (150-180)
 DPS_KEYS_TO_LOG = list(range(150, 181))
+DPS_KEYS_TO_LOG_COUNT = len(DPS_KEYS_TO_LOG)
+
+# DPS keys 150-180 as strings, in ascending order
+DPS_KEYS_150_180 = tuple(str(k) for k in DPS_KEYS_TO_LOG)
+DPS_KEYS_150_180_SET = frozenset(DPS_KEYS_150_180)
 
 # Log directory
 LOG_DIR = "eufy_dps_logs"
 
+# DPS logs are appended to one NDJSON file per device, rotated by size
+LOG_FILE_NAME = "dps_log.ndjson"
+MAX_LOG_BYTES = 10 * 1024 * 1024
+
+# Maximum rotated DPS log files kept per device (oldest are removed first)
+MAX_LOG_FILES = 10
+
 # Data keys we want to monitor - FOR LOGGING 150-180
-MONITORED_KEYS = [str(i) for i in range(150, 181)]
+MONITORED_KEYS = list(DPS_KEYS_150_180)
 
 # Clean speed mappings (for Key 158) - USED BY STATE.PY
 CLEAN_SPEED_NAMES = ["quiet", "standard", "turbo", "max"]
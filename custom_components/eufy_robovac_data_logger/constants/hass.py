@@ -1,3 +1,4 @@
 DOMAIN = 'eufy_robovac_data_logger'
 VACS = 'vacs'
 DEVICES = 'devices'
+SIGNAL_DEVICE_UPDATED = DOMAIN + '_{}_updated'
@@ -1,3 +1,6 @@
+from types import MappingProxyType
+
+
 class Base:
     def __init__(self):
         self.dps_map = {
@@ -15,6 +18,8 @@ class Base:
             'ERROR_CODE': '177',
         }
         self.robovac_data = {}
+        # Read-only live view for consumers - no copy per read
+        self.robovac_data_view = MappingProxyType(self.robovac_data)
 
     async def connect(self):
         raise NotImplementedError('Not implemented')
@@ -11,11 +11,12 @@
 import asyncio
 import json
 import logging
+import os
 import time
+from datetime import datetime
 from functools import partial
+from logging.handlers import TimedRotatingFileHandler
 from os import path
-from threading import Thread
-from datetime import datetime
 
 from google.protobuf.message import Message
 from paho.mqtt import client as mqtt
@@ -27,20 +28,15 @@ from .SharedConnect import SharedConnect
 _LOGGER = logging.getLogger(__name__)
 
 # Set up file logging for MQTT traffic
-import os
-from logging.handlers import TimedRotatingFileHandler
-
 # Create a separate logger for MQTT traffic
 mqtt_logger = logging.getLogger('eufy_mqtt_traffic')
 mqtt_logger.setLevel(logging.DEBUG)
 
 # Create logs directory if it doesn't exist
 log_dir = "/config/logs"
-if not os.path.exists(log_dir):
-    os.makedirs(log_dir)
+os.makedirs(log_dir, exist_ok=True)
 
 # Create a log filename with date
-from datetime import datetime
 date_str = datetime.now().strftime("%Y%m%d")
 log_file = os.path.join(log_dir, f"eufy_mqtt_log_{date_str}.log")
 
@@ -92,12 +88,14 @@ class MqttConnect(SharedConnect):
         self.deviceId = config['deviceId']
         self.deviceModel = config['deviceModel']
         self.config = config
-        self.debugLog = config.get('debug', False)
         self.openudid = openudid
         self.eufyCleanApi = eufyCleanApi
         self.mqttClient = None
         self.mqttCredentials = None
         self._loop = None  # Store reference to the event loop
+        self._first_data_logged = False
+        # time.monotonic() of the last message - immune to wall clock jumps
+        self.last_data_received = None
 
     async def connect(self):
         # Store the current event loop for later use
@@ -125,10 +123,7 @@ class MqttConnect(SharedConnect):
             self.mqttCredentials = mqttCredentials
             username = self.mqttCredentials['thing_name']
             client_id = f"android-{self.mqttCredentials['app_name']}-eufy_android_{self.openudid}_{self.mqttCredentials['user_id']}-{int(time.time() * 1000)}"
-            _LOGGER.debug('Setup MQTT Connection', {
-                'clientId': client_id,
-                'username': username,
-            })
+            _LOGGER.debug('Setup MQTT Connection: clientId=%s, username=%s', client_id, username)
             if self.mqttClient:
                 self.mqttClient.disconnect()
             # When calling a blocking function in your library code
@@ -220,13 +215,17 @@ class MqttConnect(SharedConnect):
     def on_message(self, client, userdata, msg: Message):
         """Log everything for debugging and handle messages"""
         try:
+            # The traffic logger is always at DEBUG - gate on the debug option
+            debug = self.debug_log
+
             # Log to file instead of HA log
             mqtt_logger.info(f"=== MQTT MESSAGE RECEIVED ===")
             mqtt_logger.info(f"  Topic: {msg.topic}")
             mqtt_logger.info(f"  QoS: {msg.qos}")
             mqtt_logger.info(f"  Retain: {msg.retain}")
             mqtt_logger.info(f"  Payload length: {len(msg.payload)} bytes")
-            mqtt_logger.debug(f"  Raw payload (first 200 chars): {str(msg.payload)[:200]}")
+            if debug:
+                mqtt_logger.debug(f"  Raw payload (first 200 chars): {str(msg.payload)[:200]}")
             
             # Try to decode as JSON
             try:
@@ -237,7 +236,7 @@ class MqttConnect(SharedConnect):
                 messageParsed = {}
             
             # Track that we received data - still log to HA for basic status
-            self.last_data_received = time.time()
+            self.last_data_received = time.monotonic()
             
             # Get the payload data - try multiple paths
             payload_data = None
@@ -263,16 +262,17 @@ class MqttConnect(SharedConnect):
                 mqtt_logger.info(f"  DPS Data: {json.dumps(payload_data, indent=2)}")
                 
                 # Only log to HA if it's the first data received after connection
-                if not hasattr(self, '_first_data_logged'):
+                if not self._first_data_logged:
                     _LOGGER.info(f"First DPS data received - robot is active")
                     self._first_data_logged = True
                 
                 # Log hex dump of any binary data
-                for key, value in payload_data.items():
-                    if isinstance(value, (bytes, bytearray)):
-                        mqtt_logger.debug(f"  DPS {key} (hex): {value.hex()}")
-                    elif isinstance(value, str) and len(value) > 50:
-                        mqtt_logger.debug(f"  DPS {key} (truncated): {value[:50]}...")
+                if debug:
+                    for key, value in payload_data.items():
+                        if isinstance(value, (bytes, bytearray)):
+                            mqtt_logger.debug(f"  DPS {key} (hex): {value.hex()}")
+                        elif isinstance(value, str) and len(value) > 50:
+                            mqtt_logger.debug(f"  DPS {key} (truncated): {value[:50]}...")
                 
                 # Schedule the async function to run in the event loop
                 if self._loop and not self._loop.is_closed():
@@ -284,11 +284,12 @@ class MqttConnect(SharedConnect):
                     _LOGGER.warning("Event loop not available for message processing")
             else:
                 mqtt_logger.info("  No DPS data found in message")
-                mqtt_logger.debug(f"  Message structure: {list(messageParsed.keys()) if isinstance(messageParsed, dict) else 'not a dict'}")
+                if debug:
+                    mqtt_logger.debug(f"  Message structure: {list(messageParsed.keys()) if isinstance(messageParsed, dict) else 'not a dict'}")
                 
         except Exception as error:
-            _LOGGER.error(f'Error processing message: {error}', exc_info=True)
-            mqtt_logger.error(f'Error processing message: {error}', exc_info=True)
+            # Traffic logger propagates, so this also reaches the HA log
+            mqtt_logger.exception('Error processing message: %s', error)
 
     def on_disconnect(self, client, userdata, rc):
         if rc != 0:
@@ -306,16 +307,19 @@ class MqttConnect(SharedConnect):
             mqtt_logger.info(f"  DPS Payload: {json.dumps(dataPayload, indent=2)}")
             
             # Check for any binary data in the payload
-            for key, value in dataPayload.items():
-                if isinstance(value, (bytes, bytearray)):
-                    mqtt_logger.debug(f"  DPS {key} (hex): {value.hex()}")
+            if self.debug_log:
+                for key, value in dataPayload.items():
+                    if isinstance(value, (bytes, bytearray)):
+                        mqtt_logger.debug(f"  DPS {key} (hex): {value.hex()}")
                 
+            # One clock read so payload and header carry the same timestamp
+            timestamp_ms = int(time.time()) * 1000
             payload = json.dumps({
                 'account_id': self.mqttCredentials['user_id'],
                 'data': dataPayload,
                 'device_sn': self.deviceId,
                 'protocol': 2,
-                't': int(time.time()) * 1000,
+                't': timestamp_ms,
             })
             
             mqttVal = {
@@ -327,7 +331,7 @@ class MqttConnect(SharedConnect):
                     'seed': '',
                     'sess_id': f"android-{self.mqttCredentials['app_name']}-eufy_android_{self.openudid}_{self.mqttCredentials['user_id']}",
                     'sign_code': 0,
-                    'timestamp': int(time.time()) * 1000,
+                    'timestamp': timestamp_ms,
                     'version': '1.0.0.1'
                 },
                 'payload': payload,
@@ -348,8 +352,7 @@ class MqttConnect(SharedConnect):
                 _LOGGER.error("MQTT client not connected")
                 mqtt_logger.error("MQTT client not connected - command not sent")
         except Exception as error:
-            _LOGGER.error(f"Error sending command: {error}", exc_info=True)
-            mqtt_logger.error(f"Error sending command: {error}", exc_info=True)
+            mqtt_logger.exception("Error sending command: %s", error)
     
     async def test_find_robot(self, value=None):
         """Test find robot command with a specific value - can be called from service"""
@@ -373,6 +376,11 @@ class MqttConnect(SharedConnect):
     
     async def get_battery_level(self):
         """Get the battery level from DPS key 163."""
+        return self.battery_level
+
+    @property
+    def battery_level(self):
+        """Battery level from DPS key 163, read from the last pushed data."""
         try:
             # Check if we have battery data in robovac_data
             battery_key = self.dps_map.get('BATTERY_LEVEL', '163')
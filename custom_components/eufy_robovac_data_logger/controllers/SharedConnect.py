@@ -4,6 +4,7 @@ from typing import Any, Callable
 
 from homeassistant.components.vacuum import VacuumActivity
 
+from ..const import DPS_KEYS_150_180_SET
 from ..constants.devices import EUFY_CLEAN_DEVICES
 from ..constants.state import (EUFY_CLEAN_CLEAN_SPEED, EUFY_CLEAN_CONTROL,
                                EUFY_CLEAN_NOVEL_CLEAN_SPEED)
@@ -15,42 +16,106 @@ from ..proto.cloud.control_pb2 import (ModeCtrlRequest, ModeCtrlResponse,
 from ..proto.cloud.station_pb2 import (StationRequest, ManualActionCmd)
 from ..proto.cloud.error_code_pb2 import ErrorCode
 from ..proto.cloud.work_status_pb2 import WorkStatus
-from ..utils import decode, encode, encode_message
+from ..utils import decode, encode, encode_message, sleep
 from .Base import Base
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Window in which a burst of DPS pushes is folded into one listener call
+LISTENER_COALESCE_MS = 100
+
+# WorkStatus.work_mode -> state name
+WORK_STATUS_NAMES = (
+    'standby',
+    'sleeping',
+    'error',
+    'recharging',
+    'fastmapping',
+    'cleaning',
+    'remote',
+    'recharge',
+    'pause',
+    'finished',
+    'locate',
+    'selectroom',
+    'station',
+    'cruise',
+    'breakpointrecharge',
+    'cruisepause',
+)
+
 
 class SharedConnect(Base):
     def __init__(self, config) -> None:
         super().__init__()
+        # Entry debug_mode option, passed in by EufyClean.init_device
         self.debug_log = config.get('debug', False)
         self.device_id = config['deviceId']
         self.device_model = config.get('deviceModel', '')
         self.device_model_desc = EUFY_CLEAN_DEVICES.get(self.device_model, '') or self.device_model
         self.config = {}
         self._update_listeners = []
+        # Bumped only when a pushed DPS value actually changes
+        self.dps_revision = 0
+        self._notify_pending = False
+        # Decoded status, refreshed once per changed DPS batch
+        self._snapshot = {'work': 'standby', 'speed': None}
+        # Decoded CleanParamResponse, replaced whenever its DPS key changes
+        self._clean_params = None
+        # Reverse of dps_map (DPS key -> mapped names), built once
+        self._dps_names: dict[str, tuple[str, ...]] = {}
+        for name, key in self.dps_map.items():
+            self._dps_names[key] = self._dps_names.get(key, ()) + (name,)
 
     _update_listeners: list[Callable[[], None]]
 
     async def _map_data(self, dps):
         # FIX: Store ALL DPS keys with their numeric keys
+        changed = set()
         for key, value in dps.items():
+            # Devices re-push unchanged values - skip those
+            current = self.robovac_data.get(key, _MISSING)
+            if current is value or current == value:
+                continue
+            changed.add(key)
+
             # Store with numeric key
             self.robovac_data[key] = value
             
             # Also store with mapped name if it exists
-            mapped_keys = [k for k, v in self.dps_map.items() if v == key]
-            for mapped_key in mapped_keys:
+            for mapped_key in self._dps_names.get(key, ()):
                 self.robovac_data[mapped_key] = value
 
-        if self.debug_log:
-            _LOGGER.debug('mappedData', self.robovac_data)
+        if not changed:
+            return
+        self.dps_revision += 1
+
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug and self.debug_log:
+            _LOGGER.debug('mappedData: %s', self.robovac_data)
+            _LOGGER.debug('Changed DPS keys (150-180): %s', sorted(DPS_KEYS_150_180_SET & changed))
+
+        # Only re-decode the control response when its DPS key changed
+        if self.dps_map['PLAY_PAUSE'] in changed:
+            await self.get_control_response()
+        self._refresh_snapshot(changed)
+
+        # Devices push several DPS messages per action; the first one waits
+        # for the rest of the burst and notifies listeners once for all.
+        if self._notify_pending or not self._update_listeners:
+            return
+        self._notify_pending = True
+        try:
+            await sleep(LISTENER_COALESCE_MS)
+        finally:
+            self._notify_pending = False
 
-        await self.get_control_response()
         for listener in self._update_listeners:
             try:
-                _LOGGER.debug(f'Calling listener {listener.__name__ if hasattr(listener, "__name__") else "anonymous"}')
+                if debug:
+                    _LOGGER.debug('Calling listener %s', getattr(listener, "__name__", "anonymous"))
                 # Fixed: Handle both sync and async listeners
                 if asyncio.iscoroutinefunction(listener):
                     await listener()
@@ -59,6 +124,20 @@ class SharedConnect(Base):
             except Exception as e:
                 _LOGGER.error(f'Error calling listener: {e}')
 
+    def _refresh_snapshot(self, changed):
+        """Decode the status fields whose DPS keys changed into _snapshot."""
+        if self.dps_map['WORK_STATUS'] in changed:
+            self._snapshot['work'] = self._decode_work_status()
+        if self.dps_map['CLEANING_PARAMETERS'] in changed:
+            self._clean_params = self._decode_clean_params()
+            self._snapshot['speed'] = self._decode_clean_speed()
+
+    @property
+    def status_snapshot(self) -> tuple[str, str | None]:
+        """(work status, clean speed) as of the last DPS batch."""
+        snapshot = self._snapshot
+        return snapshot['work'], snapshot['speed']
+
     def add_listener(self, listener: Callable[[], None]):
         if listener not in self._update_listeners:
             self._update_listeners.append(listener)
@@ -138,60 +217,36 @@ class SharedConnect(Base):
                 response = decode(ModeCtrlResponse, data)
                 self.robovac_data['PLAY_PAUSE_RESPONSE'] = response
             except Exception as e:
-                _LOGGER.debug('error in mapping to control response', e)
+                _LOGGER.debug('error in mapping to control response: %s', e)
 
     async def get_work_status(self) -> VacuumActivity:
+        return self._snapshot['work']
+
+    def _decode_work_status(self):
         data = self.robovac_data.get('WORK_STATUS')
         if data:
             try:
                 response = decode(WorkStatus, data)
                 state = response.work_mode
-                if state == 0:
-                    return 'standby'
-                if state == 1:
-                    return 'sleeping'
-                if state == 2:
-                    return 'error'
-                if state == 3:
-                    return 'recharging'
-                if state == 4:
-                    return 'fastmapping'
-                if state == 5:
-                    return 'cleaning'
-                if state == 6:
-                    return 'remote'
-                if state == 7:
-                    return 'recharge'
-                if state == 8:
-                    return 'pause'
-                if state == 9:
-                    return 'finished'
-                if state == 10:
-                    return 'locate'
-                if state == 11:
-                    return 'selectroom'
-                if state == 12:
-                    return 'station'
-                if state == 13:
-                    return 'cruise'
-                if state == 14:
-                    return 'breakpointrecharge'
-                if state == 15:
-                    return 'cruisepause'
+                if 0 <= state < len(WORK_STATUS_NAMES):
+                    return WORK_STATUS_NAMES[state]
                 _LOGGER.info(f"Unknown work status: {state}")
                 return state
             except Exception as e:
-                _LOGGER.debug('error in mapping to work status', e)
+                _LOGGER.debug('error in mapping to work status: %s', e)
         return 'standby'
 
     async def get_clean_params_response(self):
+        return self._clean_params
+
+    def _decode_clean_params(self):
         data = self.robovac_data.get('CLEANING_PARAMETERS')
         if data:
             try:
                 response = decode(CleanParamResponse, data)
                 return response
             except Exception as e:
-                _LOGGER.debug('error in mapping to params response', e)
+                _LOGGER.debug('error in mapping to params response: %s', e)
 
     async def get_error_response(self):
         data = self.robovac_data.get('ERROR_CODE')
@@ -200,18 +255,24 @@ class SharedConnect(Base):
                 response = decode(ErrorCode, data)
                 return response
             except Exception as e:
-                _LOGGER.debug('error in mapping to error response', e)
+                _LOGGER.debug('error in mapping to error response: %s', e)
 
     async def get_work_mode(self):
         work_status = await self.get_work_status()
         return work_status
 
     async def get_battery_level(self):
-        data = self.robovac_data.get('BATTERY_LEVEL')
-        return data
+        return self.battery_level
+
+    @property
+    def battery_level(self):
+        return self.robovac_data.get('BATTERY_LEVEL')
 
     async def get_clean_speed(self):
-        params_res = await self.get_clean_params_response()
+        return self._snapshot['speed']
+
+    def _decode_clean_speed(self):
+        params_res = self._clean_params
         if params_res and hasattr(params_res, 'clean_param') and hasattr(params_res.clean_param, 'clean_speed'):
             return EUFY_CLEAN_NOVEL_CLEAN_SPEED[params_res.clean_param.clean_speed]
         return None
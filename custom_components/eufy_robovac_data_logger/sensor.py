@@ -9,10 +9,11 @@ from homeassistant.components.sensor import (
 from homeassistant.const import PERCENTAGE
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .constants.hass import DOMAIN, DEVICES
+from .constants.hass import DOMAIN, DEVICES, SIGNAL_DEVICE_UPDATED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ async def async_setup_entry(
         sensors.append(battery_sensor)
     
     if sensors:
-        async_add_entities(sensors, True)
+        async_add_entities(sensors)
 
 class RobovacBatterySensor(SensorEntity):
     """Battery sensor for Eufy Robovac."""
@@ -41,13 +42,14 @@ class RobovacBatterySensor(SensorEntity):
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_suggested_display_precision = 0
     _attr_entity_category = None  # None makes it available for automations
+    _attr_should_poll = False  # Battery level is pushed over MQTT
 
     def __init__(self, robovac):
         super().__init__()
         self.robovac = robovac
         self._attr_unique_id = f"{robovac.device_id}_battery"
         self._attr_name = f"{robovac.device_model_desc} Battery"
-        self._attr_native_value = None
+        self._attr_native_value = robovac.battery_level
         self._attr_available = True
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, robovac.device_id)},
@@ -55,40 +57,40 @@ class RobovacBatterySensor(SensorEntity):
             manufacturer="Eufy",
             model=robovac.device_model,
         )
+        # All attribute keys up front; updates only overwrite battery_level
+        self._attr_extra_state_attributes = {
+            "battery_level": self._attr_native_value,
+            "device_id": robovac.device_id,
+            "device_model": robovac.device_model,
+        }
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        if hasattr(self.robovac, 'add_listener'):
-            def _threadsafe_update():
-                if self.hass:
-                    self.hass.create_task(self.async_update_ha_state(force_refresh=True))
-            self.robovac.add_listener(_threadsafe_update)
+        # The connection already notifies once per burst of DPS pushes
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_UPDATED.format(self.robovac.device_id),
+                self._async_refresh,
+            )
+        )
 
-    @property
-    def native_value(self):
-        return self._attr_native_value
+    @callback
+    def _async_refresh(self) -> None:
+        """Write the pushed battery level straight to the state machine."""
+        battery_level = self.robovac.battery_level
+        # The device signal fires for any DPS change - only write on a new level
+        if battery_level == self._attr_native_value:
+            return
+        self._attr_native_value = battery_level
+        self._update_attributes()
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
         """Ensure the sensor is available for automations."""
         return self._attr_available and self.robovac is not None
 
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Add useful attributes for automations."""
-        return {
-            "battery_level": self._attr_native_value,
-            "device_id": self.robovac.device_id if self.robovac else None,
-            "device_model": self.robovac.device_model if hasattr(self.robovac, 'device_model') else None
-        }
-
-    async def async_update(self) -> None:
-        """Update the battery level."""
-        if self.robovac:
-            try:
-                battery_level = await self.robovac.get_battery_level()
-                self._attr_native_value = battery_level
-                self._attr_available = True
-            except Exception as e:
-                _LOGGER.error("Failed to update battery level: %s", e)
-                self._attr_available = False
\ No newline at end of file
+    def _update_attributes(self) -> None:
+        """Add useful attributes for automations - only the level changes."""
+        self._attr_extra_state_attributes["battery_level"] = self._attr_native_value
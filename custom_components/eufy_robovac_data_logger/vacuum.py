@@ -1,25 +1,87 @@
+from __future__ import annotations
+
+import asyncio
 import logging
-from typing import Literal
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Final, Mapping
 
 from homeassistant.components.vacuum import (StateVacuumEntity, VacuumActivity,
                                              VacuumEntityFeature)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-# FIX: Use our DOMAIN, not eufy-clean's
-DOMAIN = "eufy_robovac_data_logger"
-DEVICES = "devices"
-VACS = "vacs"
+from .constants.hass import DEVICES, DOMAIN, SIGNAL_DEVICE_UPDATED, VACS
+from .constants.state import EUFY_CLEAN_NOVEL_CLEAN_SPEED
 
-from .constants.state import (EUFY_CLEAN_CLEAN_SPEED,
-                              EUFY_CLEAN_NOVEL_CLEAN_SPEED)
-from .controllers.MqttConnect import MqttConnect
-from .EufyClean import EufyClean
+if TYPE_CHECKING:
+    from .controllers.MqttConnect import MqttConnect
 
 _LOGGER = logging.getLogger(__name__)
 
+# Enum members bound once at import
+_DOCKED, _IDLE, _CLEANING, _PAUSED, _RETURNING, _ERROR = (
+    VacuumActivity.DOCKED,
+    VacuumActivity.IDLE,
+    VacuumActivity.CLEANING,
+    VacuumActivity.PAUSED,
+    VacuumActivity.RETURNING,
+    VacuumActivity.ERROR,
+)
+
+# Raw work status from the device -> HA activity
+_ACTIVITY_MAP: Final[dict[str | None, VacuumActivity]] = {
+    None: _DOCKED,
+    'standby': _IDLE,
+    'recharging': _DOCKED,
+    'sleeping': _IDLE,
+    'cleaning': _CLEANING,
+    'pause': _PAUSED,
+    'recharge': _RETURNING,
+    'remote': _CLEANING,
+    'error': _ERROR,
+}
+
+# Unknown states already reported, so the debug log fires once per state
+_UNKNOWN_STATES: set[str] = set()
+
+# Shared stand-in for send_command calls without params
+_EMPTY: Final[Mapping] = MappingProxyType({})
+
+
+def _whole_params(params: Mapping) -> Mapping:
+    """Extractor for commands that take the whole params mapping."""
+    if not params:
+        # Same missing-parameter path as the itemgetter extractors
+        raise KeyError('params')
+    return params
+
+
+# send_command name (same as the connection method) -> service params extractor
+_COMMANDS: Final[Mapping[str, Callable[[Mapping], Any]]] = MappingProxyType({
+    'room_clean': itemgetter('rooms'),
+    'set_clean_param': _whole_params,
+    'scene_clean': itemgetter('scene'),
+    'zone_clean': itemgetter('zones'),
+    'quick_clean': itemgetter('rooms'),
+    'set_map': itemgetter('map_id'),
+})
+
+
+def _activity_for(state: str | None) -> VacuumActivity:
+    """Return the HA activity for a raw device work status."""
+    activity = _ACTIVITY_MAP.get(state)
+    if activity is None:
+        # Default fallback
+        if state not in _UNKNOWN_STATES:
+            _UNKNOWN_STATES.add(state)
+            _LOGGER.debug("Unknown vacuum state: %s, defaulting to IDLE", state)
+        return _IDLE
+    return activity
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -27,17 +89,44 @@ async def async_setup_entry(
 ) -> None:
     """Initialize vacuum entities."""
     
+    entities = []
     # This should now find our devices stored by __init__.py
     for device_id, device in hass.data[DOMAIN][DEVICES].items():
         _LOGGER.info("Adding vacuum %s", device_id)
         entity = RoboVacMQTTEntity(device, hass)
         hass.data[DOMAIN][VACS][device_id] = entity
-        async_add_entities([entity])
-        
-        await entity.pushed_update_handler()
+        entities.append(entity)
+
+    async_add_entities(entities)
+
+    # Initial refreshes run together; one failing device must not fail setup
+    results = await asyncio.gather(
+        *(entity.pushed_update_handler() for entity in entities),
+        return_exceptions=True,
+    )
+    for entity, result in zip(entities, results):
+        if isinstance(result, BaseException):
+            _LOGGER.error(
+                "Initial update failed for vacuum %s", entity.vacuum.device_id, exc_info=result
+            )
 
 
 class RoboVacMQTTEntity(StateVacuumEntity):
+    _attr_fan_speed_list = EUFY_CLEAN_NOVEL_CLEAN_SPEED
+    # FIX 2 & 3: Remove battery_level attribute and BATTERY feature flag
+    # Battery is now handled by a separate sensor entity
+    _attr_supported_features = (
+        VacuumEntityFeature.START
+        | VacuumEntityFeature.PAUSE
+        | VacuumEntityFeature.STOP
+        | VacuumEntityFeature.STATUS
+        | VacuumEntityFeature.STATE
+        # REMOVED: VacuumEntityFeature.BATTERY - deprecated, use sensor instead
+        | VacuumEntityFeature.FAN_SPEED
+        | VacuumEntityFeature.RETURN_HOME
+        | VacuumEntityFeature.SEND_COMMAND
+    )
+
     def __init__(self, item: MqttConnect, hass: HomeAssistant) -> None:
         super().__init__()
         self.vacuum = item
@@ -45,78 +134,47 @@ class RoboVacMQTTEntity(StateVacuumEntity):
         self._attr_unique_id = item.device_id
         self._attr_name = item.device_model_desc
         self._attr_model = item.device_model
-        self._attr_available = True
-        self._attr_fan_speed_list = EUFY_CLEAN_NOVEL_CLEAN_SPEED
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, item.device_id)},
             name=item.device_model_desc,
             manufacturer="Eufy",
             model=item.device_model,
         )
-        self._state = None
-        self._attr_fan_speed = None
-        # FIX 2 & 3: Remove battery_level attribute and BATTERY feature flag
-        # Battery is now handled by a separate sensor entity
-        self._attr_supported_features = (
-            VacuumEntityFeature.START
-            | VacuumEntityFeature.PAUSE
-            | VacuumEntityFeature.STOP
-            | VacuumEntityFeature.STATUS
-            | VacuumEntityFeature.STATE
-            # REMOVED: VacuumEntityFeature.BATTERY - deprecated, use sensor instead
-            | VacuumEntityFeature.FAN_SPEED
-            | VacuumEntityFeature.RETURN_HOME
-            | VacuumEntityFeature.SEND_COMMAND
-        )
-
-        def _threadsafe_update():
-            self.hass.loop.call_soon_threadsafe(
-                lambda: self.hass.async_create_task(self.pushed_update_handler())
+        # activity/fan_speed are cached by HA and invalidated on assignment;
+        # fan_speed and availability keep the base class defaults
+        self._attr_activity = _activity_for(None)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # The connection already notifies once per burst of DPS pushes
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_UPDATED.format(self.vacuum.device_id),
+                self._async_refresh,
             )
-
-        item.add_listener(_threadsafe_update)
-
-    # FIX 1: Implement 'activity' property instead of 'state' property
-    @property
-    def activity(self) -> VacuumActivity:
-        """Return the activity state using VacuumActivity enum."""
-        if self._state is None:
-            return VacuumActivity.DOCKED
-        if self._state == 'standby':
-            return VacuumActivity.IDLE
-        if self._state == 'recharging':
-            return VacuumActivity.DOCKED
-        if self._state == 'sleeping':
-            return VacuumActivity.IDLE
-        if self._state == 'cleaning':
-            return VacuumActivity.CLEANING
-        if self._state == 'pause':
-            return VacuumActivity.PAUSED
-        if self._state == 'recharge':
-            return VacuumActivity.RETURNING
-        if self._state == 'remote':
-            return VacuumActivity.CLEANING
-        if self._state == 'error':
-            return VacuumActivity.ERROR
-        # Default fallback
-        _LOGGER.debug("Unknown vacuum state: %s, defaulting to IDLE", self._state)
-        return VacuumActivity.IDLE
-
-    @property
-    def fan_speed(self) -> str:
-        """Return the fan speed of the vacuum."""
-        return self._attr_fan_speed
+        )
 
     async def pushed_update_handler(self):
         """Handle updates pushed from the vacuum."""
+        self._async_refresh()
+
+    @callback
+    def _async_refresh(self) -> None:
+        """Write the pushed status straight to the state machine."""
         _LOGGER.debug("Pushed update handler called")
-        work_status = await self.vacuum.get_work_status()
-        self._state = work_status
-        # FIX 2: Don't set battery_level here - it's handled by sensor now
-        # Removed: battery_level = await self.vacuum.get_battery_level()
-        # Removed: self._attr_battery_level = battery_level
-        clean_speed = await self.vacuum.get_clean_speed()
-        self._attr_fan_speed = clean_speed
+        # Status is decoded once per MQTT batch by the connection - no awaits
+        # FIX 2: battery is handled by the sensor entity, not set here
+        work, speed = self.vacuum.status_snapshot
+        activity = _activity_for(work)
+        # Nothing observable changed (e.g. a battery-only push) - skip the write
+        if (activity, speed) == (self._attr_activity, self._attr_fan_speed):
+            return
+        # Only reassign on change so HA keeps its cached property values
+        if activity != self._attr_activity:
+            self._attr_activity = activity
+        if speed != self._attr_fan_speed:
+            self._attr_fan_speed = speed
         self.async_write_ha_state()
 
     async def async_start(self) -> None:
@@ -143,17 +201,15 @@ class RoboVacMQTTEntity(StateVacuumEntity):
         self, command: str, params: dict = None, **kwargs
     ) -> None:
         """Send a command to the vacuum."""
-        if command == "room_clean":
-            await self.vacuum.room_clean(params["rooms"])
-        elif command == "set_clean_param":
-            await self.vacuum.set_clean_param(params)
-        elif command == "scene_clean":
-            await self.vacuum.scene_clean(params["scene"])
-        elif command == "zone_clean":
-            await self.vacuum.zone_clean(params["zones"])
-        elif command == "quick_clean":
-            await self.vacuum.quick_clean(params["rooms"])
-        elif command == "set_map":
-            await self.vacuum.set_map(params["map_id"])
-        else:
-            _LOGGER.warning("Unknown command: %s", command)
\ No newline at end of file
+        try:
+            extract = _COMMANDS[command]
+        except KeyError:
+            _LOGGER.warning("Unknown command: %s", command)
+            return
+        try:
+            value = extract(params or _EMPTY)
+        except KeyError as key:
+            _LOGGER.warning("Command %s is missing parameter %s", command, key)
+            return
+        # Looked up on the instance so connection subclasses can override
+        await getattr(self.vacuum, command)(value)